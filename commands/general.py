@@ -1,6 +1,8 @@
 import discord
+import httpx
 from discord.ext import commands
-from ollama_custom.ollama import Llama
+from ollama import ResponseError
+from ollama_custom.ollama import Llama, fit
 from logger.logger import Logger
 
 class General(commands.Cog):
@@ -13,16 +15,22 @@ class General(commands.Cog):
 
     @commands.command()
     async def query(self,ctx, model, q):
-      if model in Llama.list():
-        await ctx.reply(Llama.promptGen(q, model))
-      else:
+      # let ollama tell us about unknown models instead of listing them every time
+      try:
+        await ctx.reply(fit(await Llama.promptGen(q, model)))
+      except ResponseError as e:
+        if e.status_code != 404:
+          raise
         Logger.writter("Invalid model")
         await ctx.reply("Please select a valid model")
+      except httpx.TimeoutException:
+        Logger.writter("ollama timed out")
+        await ctx.reply("The model took too long to answer, try again later")
 
     @commands.command()
     async def list(self, message):
       await message.channel.typing()
-      msg = Llama.list()
+      msg = await Llama.list()
       Logger.writter("Listing models")
       await message.reply(msg)
 async def setup(bot):
@@ -1,6 +1,7 @@
 from dotenv import load_dotenv
 import discord
 import os
+import re
 
 class Config:
     load_dotenv()
@@ -13,6 +14,28 @@ class Config:
     def get_ollama():
         ollamaSrv = os.getenv("OLLAMA_URL")
         return ollamaSrv
+    def get_timeout():
+        timeout = os.getenv("OLLAMA_TIMEOUT")
+        if not timeout:
+            return None
+        try:
+            return float(timeout)
+        except ValueError:
+            print(f'OLLAMA_TIMEOUT must be a number of seconds, got {timeout!r}')
+            exit(1)
+    def get_keep_alive():
+        keep_alive = os.getenv("OLLAMA_KEEP_ALIVE")
+        if not keep_alive:
+            return None
+        try:
+            return float(keep_alive)
+        except ValueError:
+            pass
+        # same duration format ollama itself takes, e.g. 30m or 1h30m
+        if re.fullmatch(r'-?(\d+(\.\d*)?(ns|us|µs|ms|s|m|h))+', keep_alive):
+            return keep_alive
+        print(f'OLLAMA_KEEP_ALIVE must be seconds or a duration like 30m, got {keep_alive!r}')
+        exit(1)
     def get_model():
         model = os.getenv("OLLAMA_MODEL")
         return str(model)
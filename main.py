@@ -1,13 +1,10 @@
 import asyncio
 import discord
+import httpx
 from discord.ext import commands
 from config.config import Config
 from logger.logger import Logger
-from PIL import Image
-from ollama_custom.ollama import Llama
-import requests
-import base64
-import shutil
+from ollama_custom.ollama import Llama, fit
 # This is going to fail somewhere else
 # logging stuff
 Logger.cfg(Config.set_loglvl())
@@ -17,30 +14,41 @@ bot = commands.Bot(command_prefix='?', description='Nebula AI interact with an L
 if __name__ == "__main__" :
 
     @bot.event
-    async def on_ready():
-       Logger.writter(f'Logged in as {bot.user} (ID: {bot.user.id})')
+    async def setup_hook():
+       # runs once before connecting, on_ready fires again on every reconnect
        for extension in Config.extensions():
         print("loading extensions")
         await bot.load_extension(extension)
+       # keep a ref so the task isn't garbage collected
+       bot.warmup = asyncio.create_task(Llama.warmup(Config.get_model()))
+
+    @bot.event
+    async def on_ready():
+       Logger.writter(f'Logged in as {bot.user} (ID: {bot.user.id})')
        
     @bot.event
     async def on_message(message):
-      if bot.user.mention in message.content.split():
+      if message.author == bot.user: # our own replies, nothing to do (commands ignore bots too)
+         return
+      if bot.user.id in message.raw_mentions:
          try:
             await message.channel.typing() #I like this feature 
             if not message.attachments:
                msg = await Llama.promptGen(message.content, Config.get_model()) #big brain llm messages
                Logger.writter("ollama message length:" +  str(len(msg)) )
-               await message.reply(msg)
+               await message.reply(fit(msg))
             elif "image" in message.attachments[0].content_type:
                   reply = await Llama.imgPrompt(message.content, message.attachments[0])
-                  await message.reply(reply)
+                  await message.reply(fit(reply))
             else: 
                pass
          except discord.errors.HTTPException: #EXCEPTIONSSSSSS
             await message.channel.typing()
             msg="I cant reply to that"
             await message.reply(msg)
+         except httpx.TimeoutException: # OLLAMA_TIMEOUT was hit
+            Logger.writter("ollama timed out")
+            await message.reply("The model took too long to answer, try again later")
       await bot.process_commands(message)
     async def main():
       async with bot:
@@ -3,50 +3,63 @@ from logger.logger import Logger
 from PIL import Image
 from ollama import AsyncClient
 
+import io
 import re
-import requests
-import json
-import ollama
-import shutil
-import asyncio
 
 
+MENTION_RE = re.compile(r'<(.*?)>')
+MAX_MSG_LEN = 2000 # discord rejects anything longer
+
+# one client for the whole bot so connections get reused between messages
+client = AsyncClient(host=Config.get_ollama(), timeout=Config.get_timeout())
+# None leaves it to the server (OLLAMA_KEEP_ALIVE on the ollama side, 5m by default)
+KEEP_ALIVE = Config.get_keep_alive()
+
+def fit(msg):
+    # only add the ... when we actually cut something
+    if len(msg) <= MAX_MSG_LEN:
+        return msg
+    return msg[:MAX_MSG_LEN - 3] + "..."
+
 #set_debug(True)
 #ollama = Ollama(base_url=str(Config.get_ollama()),model=Config.get_model()) 
 class Llama: 
     async def promptGen(msg, model):
-        Logger.writter(f'Using {Config.get_model()} to generate response')
-        aimodel = Config.get_model()
-        messages= {'role': 'user', 'content': re.sub(r'<(.*?)>', '', msg)}
+        Logger.writter(f'Using {model} to generate response')
+        prompt = MENTION_RE.sub('', msg).strip()
+        if not prompt:
+            # just a mention, no point waking the model up for that
+            return "Ask me something"
+        messages= {'role': 'user', 'content': prompt}
 
-        resp = await AsyncClient().chat(model, messages=[messages])
+        resp = await client.chat(model, messages=[messages], keep_alive=KEEP_ALIVE)
 
         Logger.writter("The response from the ollama ep is ~> {resp}")
         return resp['message']['content']
                       
-    async def imgPrompt(msg, url):
-        Logger.writter(f'url is {url}')
-        response = requests.get(url, stream=True)
-        MAGIC_STATIC_VAR = "insert_fn.png"
-        leprompt = re.sub(r'<(.*?)>', '', msg)
-        
-        with open(MAGIC_STATIC_VAR, 'wb')  as out_file:
-            shutil.copyfileobj(response.raw, out_file)
-
-            del response
-
-            img = Image.open(MAGIC_STATIC_VAR).convert("RGB")
-            img.save(MAGIC_STATIC_VAR, "png")
-
-            with open(MAGIC_STATIC_VAR, 'rb') as file:
-                messages={'role': 'user','content': leprompt,'images': [file.read()]}
-                resp = await AsyncClient().chat("llava", messages=[messages])
+    async def imgPrompt(msg, attachment):
+        Logger.writter(f'attachment is {attachment}')
+        leprompt = MENTION_RE.sub('', msg)
+        image = await attachment.read()
+
+        png = io.BytesIO()
+        Image.open(io.BytesIO(image)).convert("RGB").save(png, "png")
+
+        messages={'role': 'user','content': leprompt,'images': [png.getvalue()]}
+        resp = await client.chat("llava", messages=[messages], keep_alive=KEEP_ALIVE)
         Logger.writter("The response from the ollama ep is ~> {resp}")
         return resp['message']['content']
 
-    def list():
-        response = requests.get(Config.get_ollama() + '/api/tags')
-        models = response.json()
-        names = [model["name"] for model in models["models"]]
+    async def warmup(model):
+        # a chat with no messages just loads the model, so the first mention doesn't wait for it
+        try:
+            await client.chat(model, messages=[], keep_alive=KEEP_ALIVE)
+            Logger.writter(f'{model} loaded')
+        except Exception as e:
+            Logger.writter(f'Could not preload {model} ~> {e}')
+
+    async def list():
+        models = await client.list()
+        names = [model["model"] for model in models["models"]]
         return names
 